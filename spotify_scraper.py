@@ -4,18 +4,30 @@ Spotify Playlist Scraper Backend
 Uses headless browser to extract tracks automatically with multi-browser fallback
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 import re
 import os
 import time
 import glob
+import gzip
+import hashlib
+import json
+import math
+import shutil
 import signal
+import subprocess
 import sys
+import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from contextlib import contextmanager
 
 app = Flask(__name__)
+SERVER_STARTED_AT = datetime.now()
 CORS(app)
 
 def log_message(message):
@@ -49,6 +61,11 @@ def extract_playlist_id(url):
 @contextmanager
 def timeout_handler(seconds):
     """Context manager for handling timeouts"""
+    # SIGALRM can only be used from the main thread; warm scrapes are bounded by the warmer's budget instead
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    
     def timeout_signal(signum, frame):
         raise TimeoutError(f"Operation timed out after {seconds} seconds")
     
@@ -96,9 +113,255 @@ def check_browser_availability():
         availability['drivers'][name] = os.path.exists(path)
     
     return availability
+
+# Persistent browser profile templates with a warmed HTTP/code cache
+BROWSER_PROFILE_ENABLED = os.environ.get('BROWSER_PROFILE_ENABLED', '1') != '0'
+BROWSER_PROFILE_ROOT = os.environ.get('BROWSER_PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'spotify-scraper-profiles'))
+BROWSER_CACHE_MAX_MB = int(os.environ.get('BROWSER_CACHE_MAX_MB', 200))
+BROWSER_PROFILE_MAX_AGE = int(os.environ.get('BROWSER_PROFILE_MAX_AGE', 6 * 3600))  # Rebuild templates this often
+
+# Session state and lock files that must never be carried into a template
+PROFILE_IGNORE_PATTERNS = shutil.ignore_patterns(
+    'Singleton*', 'lock', '.parentlock', 'parent.lock', 'Cookies*', 'Sessions',
+    'Current Session', 'Current Tabs', 'sessionstore*', 'cookies.sqlite*', 'Crashpad'
+)
+
+PROFILE_LEFTOVER_AGE = 3600  # Clones and staging dirs older than this belong to dead processes
+
+_browser_profile_lock = threading.Lock()
+_profile_leftovers_cleaned = False
+
+def _template_dir(browser):
+    return os.path.join(BROWSER_PROFILE_ROOT, f'{browser}-template')
+
+def clean_profile_leftovers():
+    """Remove clones and staging dirs left behind by crashed or killed processes"""
+    cutoff = time.time() - PROFILE_LEFTOVER_AGE
+    clones_root = os.path.join(BROWSER_PROFILE_ROOT, 'clones')
+    leftovers = [os.path.join(clones_root, name) for name in os.listdir(clones_root)] if os.path.isdir(clones_root) else []
+    leftovers += glob.glob(os.path.join(BROWSER_PROFILE_ROOT, '*.staging-*'))
+    
+    removed = 0
+    for path in leftovers:
+        try:
+            if os.stat(path).st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+    if removed:
+        log_message(f"🧹 Removed {removed} leftover browser profile directories")
+
+def _dir_size(path):
+    """Total size in bytes of all files under path"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def _copy_profile_tree(src, dst):
+    """Copy a profile, using copy-on-write reflinks where the filesystem supports them"""
+    try:
+        subprocess.run(['cp', '-a', '--reflink=auto', src, dst], check=True, capture_output=True, timeout=60)
+    except (OSError, subprocess.SubprocessError):
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst, symlinks=True)
+
+def _write_firefox_cache_prefs(profile_dir):
+    """Pin Firefox's disk cache on and to a fixed size inside the profile"""
+    prefs = [
+        ('browser.cache.disk.enable', 'true'),
+        ('browser.cache.disk.smart_size.enabled', 'false'),
+        ('browser.cache.disk.capacity', str(BROWSER_CACHE_MAX_MB * 1024)),
+        ('browser.shell.checkDefaultBrowser', 'false')
+    ]
+    with open(os.path.join(profile_dir, 'user.js'), 'w', encoding='utf-8') as f:
+        for name, value in prefs:
+            f.write(f'user_pref("{name}", {value});\n')
+
+def template_is_usable(browser):
+    """Return True if the browser's template exists, is recent and within its size limit"""
+    template = _template_dir(browser)
+    try:
+        age = time.time() - os.stat(template).st_mtime
+    except OSError:
+        return False
+    
+    if age > BROWSER_PROFILE_MAX_AGE:
+        log_message(f"🗂️ {browser} profile template is {int(age)}s old, rebuilding")
+        return False
+    if _dir_size(template) > BROWSER_CACHE_MAX_MB * 1024 * 1024 * 1.5:
+        log_message(f"🗂️ {browser} profile template exceeds size limit, rebuilding")
+        return False
+    return True
+
+def acquire_browser_profile(browser):
+    """Create a throwaway clone of the browser's warmed profile template for one scrape"""
+    if not BROWSER_PROFILE_ENABLED:
+        return None
+    
+    global _profile_leftovers_cleaned
+    clone = os.path.join(BROWSER_PROFILE_ROOT, 'clones', f'{browser}-{uuid.uuid4().hex}')
+    try:
+        os.makedirs(os.path.dirname(clone), exist_ok=True)
+        
+        with _browser_profile_lock:
+            if not _profile_leftovers_cleaned:
+                _profile_leftovers_cleaned = True
+                clean_profile_leftovers()
+            
+            if template_is_usable(browser):
+                _copy_profile_tree(_template_dir(browser), clone)
+                log_message(f"🗂️ Cloned warmed {browser} profile template")
+            else:
+                shutil.rmtree(_template_dir(browser), ignore_errors=True)
+                os.makedirs(clone)
+        
+        if browser == 'firefox':
+            _write_firefox_cache_prefs(clone)
+        return clone
+    except Exception as e:
+        log_message(f"⚠️ Could not prepare {browser} profile, using a fresh one: {e}")
+        shutil.rmtree(clone, ignore_errors=True)
+        return None
+
+def release_browser_profile(browser, clone, promote=False):
+    """Remove a profile clone, first seeding the template from it if none exists yet"""
+    if not clone:
+        return
+    
+    staging = None
+    try:
+        if promote:
+            with _browser_profile_lock:
+                template = _template_dir(browser)
+                if not os.path.exists(template):
+                    staging = f'{template}.staging-{uuid.uuid4().hex}'
+                    shutil.copytree(clone, staging, symlinks=True, ignore=PROFILE_IGNORE_PATTERNS)
+                    os.rename(staging, template)
+                    os.utime(template)
+                    log_message(f"🗂️ Seeded {browser} profile template ({_dir_size(template) // 1024} KB)")
+    except Exception as e:
+        log_message(f"⚠️ Could not seed {browser} profile template: {e}")
+    finally:
+        shutil.rmtree(clone, ignore_errors=True)
+        if staging:
+            # Left behind if another worker seeded the template first
+            shutil.rmtree(staging, ignore_errors=True)
+
+# Rolling success stats and circuit breakers for browser and driver strategies
+STRATEGY_WINDOW = 20  # Outcomes kept per strategy
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', 3))
+BREAKER_COOLDOWN = int(os.environ.get('BREAKER_COOLDOWN', 300))  # Seconds before a half-open probe
+STRATEGY_PRIOR_SECONDS = 30.0  # Assumed latency for strategies without a success yet
+
+_strategy_stats = {}
+_strategy_lock = threading.Lock()
+
+def _get_strategy(name):
+    return _strategy_stats.setdefault(name, {
+        'outcomes': deque(maxlen=STRATEGY_WINDOW),
+        'consecutive_failures': 0,
+        'state': 'closed',
+        'opened_at': None,
+        'probe_started': None
+    })
+
+def _expected_time_to_success(stats):
+    """Mean success latency divided by the smoothed success rate"""
+    outcomes = stats['outcomes']
+    successes = [seconds for ok, seconds in outcomes if ok]
+    success_rate = (len(successes) + 1) / (len(outcomes) + 2)
+    latency = sum(successes) / len(successes) if successes else STRATEGY_PRIOR_SECONDS
+    return latency / success_rate
+
+def _probe_idle(stats, now):
+    """True if no half-open probe is running; one that never reported back is abandoned after a cooldown"""
+    return stats['probe_started'] is None or now - stats['probe_started'] >= BREAKER_COOLDOWN
+
+def select_strategies(names):
+    """Return the strategies worth trying, fastest expected success first"""
+    now = time.time()
+    allowed = []
+    with _strategy_lock:
+        for name in names:
+            stats = _get_strategy(name)
+            if stats['state'] == 'open' and now - stats['opened_at'] >= BREAKER_COOLDOWN:
+                stats['state'] = 'half-open'
+                stats['probe_started'] = None
+            if stats['state'] == 'closed' or (stats['state'] == 'half-open' and _probe_idle(stats, now)):
+                allowed.append(name)
+        
+        # Stable sort keeps the default order until there is data to go on
+        allowed.sort(key=lambda name: _expected_time_to_success(_strategy_stats[name]))
+    
+    skipped = [name for name in names if name not in allowed]
+    if skipped:
+        log_message(f"⚡ Circuit open, skipping: {', '.join(skipped)}")
+    return allowed
+
+def begin_strategy(name):
+    """Claim the right to attempt a strategy now, reserving the probe if it is half-open"""
+    with _strategy_lock:
+        stats = _get_strategy(name)
+        if stats['state'] == 'closed':
+            return True
+        now = time.time()
+        if stats['state'] == 'half-open' and _probe_idle(stats, now):
+            stats['probe_started'] = now
+            return True
+    log_message(f"⚡ Probe for {name} already running, skipping")
+    return False
+
+def release_strategy(name):
+    """Give back a probe reservation for an attempt that ended without a meaningful outcome"""
+    with _strategy_lock:
+        _get_strategy(name)['probe_started'] = None
+
+def record_strategy_result(name, ok, seconds):
+    """Record a strategy outcome and open, close or re-open its breaker"""
+    with _strategy_lock:
+        stats = _get_strategy(name)
+        stats['outcomes'].append((ok, seconds))
+        stats['probe_started'] = None
+        
+        if ok:
+            if stats['state'] != 'closed':
+                log_message(f"✅ Circuit closed for {name}")
+            stats['consecutive_failures'] = 0
+            stats['state'] = 'closed'
+            stats['opened_at'] = None
+            return
+        
+        stats['consecutive_failures'] += 1
+        if stats['state'] == 'half-open' or stats['consecutive_failures'] >= BREAKER_FAILURE_THRESHOLD:
+            if stats['state'] != 'open':
+                log_message(f"🚫 Circuit opened for {name} after {stats['consecutive_failures']} failures")
+            stats['state'] = 'open'
+            stats['opened_at'] = time.time()
+
+def get_strategy_summary():
+    """Summarize strategy stats for the health endpoint"""
+    with _strategy_lock:
+        summary = {}
+        for name, stats in _strategy_stats.items():
+            outcomes = stats['outcomes']
+            successes = sum(1 for ok, _ in outcomes if ok)
+            summary[name] = {
+                'state': stats['state'],
+                'success_rate': round(successes / len(outcomes), 2) if outcomes else None,
+                'samples': len(outcomes),
+                'expected_seconds': round(_expected_time_to_success(stats), 1)
+            }
+        return summary
+
 # Replace your browser setup functions with these webdriver-manager only versions
 
-def setup_chrome_driver():
+def setup_chrome_driver(profile_dir=None):
     """Set up Chrome driver using webdriver-manager only"""
     try:
         from selenium import webdriver
@@ -129,6 +392,11 @@ def setup_chrome_driver():
         for option in chrome_options:
             options.add_argument(option)
         
+        # Reuse the warmed HTTP and code cache from the profile clone
+        if profile_dir:
+            options.add_argument(f'--user-data-dir={profile_dir}')
+            options.add_argument(f'--disk-cache-size={BROWSER_CACHE_MAX_MB * 1024 * 1024}')
+        
         # Let webdriver-manager handle everything
         log_message("📥 Downloading Chrome and ChromeDriver via webdriver-manager...")
         service = Service(ChromeDriverManager().install())
@@ -141,7 +409,7 @@ def setup_chrome_driver():
         log_message(f"❌ Chrome webdriver-manager setup failed: {e}")
         raise
 
-def setup_firefox_driver():
+def setup_firefox_driver(profile_dir=None):
     """Set up Firefox driver using webdriver-manager only"""
     try:
         from selenium import webdriver
@@ -162,6 +430,11 @@ def setup_firefox_driver():
         for option in firefox_options:
             options.add_argument(option)
         
+        # Reuse the warmed HTTP and code cache from the profile clone
+        if profile_dir:
+            options.add_argument('-profile')
+            options.add_argument(profile_dir)
+        
         # Let webdriver-manager handle everything
         log_message("📥 Downloading Firefox and GeckoDriver via webdriver-manager...")
         service = Service(GeckoDriverManager().install())
@@ -197,7 +470,7 @@ def _try_chrome_with_webdriver_manager(options):
     except ImportError:
         raise Exception("webdriver-manager not available")
 
-def setup_firefox_driver():
+def setup_firefox_driver(profile_dir=None):
     """Set up Firefox headless driver"""
     try:
         from selenium import webdriver
@@ -217,6 +490,11 @@ def setup_firefox_driver():
         for option in firefox_options:
             options.add_argument(option)
         
+        # Reuse the warmed HTTP and code cache from the profile clone
+        if profile_dir:
+            options.add_argument('-profile')
+            options.add_argument(profile_dir)
+        
         # Try to find Firefox binary
         firefox_paths = [
             '/usr/bin/firefox',
@@ -234,28 +512,35 @@ def setup_firefox_driver():
             options.binary_location = found_firefox
         
         # Try different driver approaches
-        driver_attempts = [
+        driver_attempts = {
             # Method 1: Use environment variable
-            lambda: _try_firefox_with_driver(options, os.environ.get('GECKODRIVER_PATH')),
+            'firefox-driver:env': lambda: _try_firefox_with_driver(options, os.environ.get('GECKODRIVER_PATH')),
             # Method 2: Use local bin
-            lambda: _try_firefox_with_driver(options, '/usr/local/bin/geckodriver'),
+            'firefox-driver:local': lambda: _try_firefox_with_driver(options, '/usr/local/bin/geckodriver'),
             # Method 3: Use system bin  
-            lambda: _try_firefox_with_driver(options, '/usr/bin/geckodriver'),
+            'firefox-driver:system': lambda: _try_firefox_with_driver(options, '/usr/bin/geckodriver'),
             # Method 4: Let selenium find driver
-            lambda: webdriver.Firefox(options=options),
+            'firefox-driver:selenium': lambda: webdriver.Firefox(options=options),
             # Method 5: Try webdriver-manager
-            lambda: _try_firefox_with_webdriver_manager(options)
-        ]
+            'firefox-driver:webdriver-manager': lambda: _try_firefox_with_webdriver_manager(options)
+        }
         
-        for i, attempt in enumerate(driver_attempts, 1):
+        # Skip methods that keep failing, most likely to succeed quickly first
+        for name in select_strategies(list(driver_attempts)):
+            if not begin_strategy(name):
+                continue
+            started = time.monotonic()
             try:
-                log_message(f"🔧 Firefox driver attempt {i}...")
-                driver = attempt()
+                log_message(f"🔧 Firefox driver attempt {name}...")
+                driver = driver_attempts[name]()
                 if driver:
-                    log_message(f"✅ Firefox driver created successfully on attempt {i}!")
+                    record_strategy_result(name, True, time.monotonic() - started)
+                    log_message(f"✅ Firefox driver created successfully with {name}!")
                     return driver
+                record_strategy_result(name, False, time.monotonic() - started)
             except Exception as e:
-                log_message(f"❌ Firefox attempt {i} failed: {str(e)[:100]}")
+                record_strategy_result(name, False, time.monotonic() - started)
+                log_message(f"❌ Firefox attempt {name} failed: {str(e)[:100]}")
                 continue
         
         raise Exception("All Firefox driver attempts failed")
@@ -287,65 +572,282 @@ def _try_firefox_with_webdriver_manager(options):
     except ImportError:
         raise Exception("webdriver-manager not available")
 
-def extract_tracks_from_page(driver):
-    """Extract track URIs from loaded Spotify page with comprehensive scrolling"""
+# Adaptive scroll/wait timing, learned from previous scrapes
+SCRAPE_STATS_PATH = 'scrape_stats.json'
+SCRAPE_STATS_ALPHA = 0.3  # Weight of the newest observation in running averages
+DEFAULT_MAX_SCROLL_ATTEMPTS = 15
+MAX_SCROLL_ATTEMPTS_CAP = 60
+DEFAULT_SCROLL_PAUSE = 0.5
+DEFAULT_SETTLE_WAIT = 2.0
+DEFAULT_SCROLL_TIME_BUDGET = 150  # Seconds of scrolling allowed while tracks keep loading
+MIN_SCROLL_TIME_BUDGET = 60
+SCRAPE_STATS_MAX_PLAYLISTS = 500  # Least recently scraped playlists are dropped beyond this
+
+# (id prefix, class name, fixed playlist size or None if it varies)
+PLAYLIST_CLASSES = [
+    ('37i9dQZF1E', 'algorithmic', 50),    # Song Radio, Daily Mix
+    ('37i9dQZEVX', 'personalized', 30),   # Discover Weekly, Release Radar
+    ('37i9dQZF1D', 'editorial', None)
+]
+
+_scrape_stats = None
+_scrape_stats_lock = threading.Lock()
+
+def classify_playlist(playlist_id):
+    """Return (class name, fixed size or None) for a playlist ID"""
+    for prefix, name, fixed_size in PLAYLIST_CLASSES:
+        if playlist_id.startswith(prefix):
+            return name, fixed_size
+    return 'user', None
+
+def load_scrape_stats():
+    """Load recorded scrape stats from disk once, keeping them in memory afterwards"""
+    global _scrape_stats
+    if _scrape_stats is None:
+        stats = {'classes': {}, 'playlists': {}}
+        try:
+            with open(SCRAPE_STATS_PATH, 'r', encoding='utf-8') as f:
+                stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass  # Start fresh if there are no stats yet
+        _scrape_stats = stats
+    return _scrape_stats
+
+def _update_stats_entry(entry, track_count, stable_seconds, scrolls, load_latency, truncated):
+    """Fold one observation into a stats entry using running averages"""
+    if not entry.get('samples'):
+        entry.update({
+            'samples': 0,
+            'tracks': track_count,
+            'max_tracks': track_count,
+            'stable_seconds': stable_seconds,
+            'scrolls': scrolls,
+            'load_latency': load_latency
+        })
+    
+    alpha = SCRAPE_STATS_ALPHA
+    entry['samples'] += 1
+    entry['tracks'] = round((1 - alpha) * entry['tracks'] + alpha * track_count, 2)
+    entry['max_tracks'] = max(entry['max_tracks'], track_count)
+    entry['stable_seconds'] = round((1 - alpha) * entry['stable_seconds'] + alpha * stable_seconds, 2)
+    entry['scrolls'] = round((1 - alpha) * entry['scrolls'] + alpha * scrolls, 2)
+    if load_latency is not None:
+        previous = entry.get('load_latency')
+        entry['load_latency'] = round(load_latency if previous is None else (1 - alpha) * previous + alpha * load_latency, 3)
+    entry['last_tracks'] = track_count
+    entry['truncated'] = truncated
+    entry['last_seen'] = time.time()
+
+def record_scrape_observation(playlist_id, track_count, stable_seconds, scrolls, load_latency, truncated):
+    """Record observed track count and time-to-stable for a playlist and its class"""
+    if not playlist_id or track_count <= 0:
+        return
+    
+    playlist_class, _ = classify_playlist(playlist_id)
+    with _scrape_stats_lock:
+        stats = load_scrape_stats()
+        playlists = stats['playlists']
+        for entry in (playlists.setdefault(playlist_id, {}),
+                      stats['classes'].setdefault(playlist_class, {})):
+            _update_stats_entry(entry, track_count, stable_seconds, scrolls, load_latency, truncated)
+        
+        if len(playlists) > SCRAPE_STATS_MAX_PLAYLISTS:
+            by_age = sorted(playlists, key=lambda key: playlists[key].get('last_seen', 0))
+            for key in by_age[:len(playlists) - SCRAPE_STATS_MAX_PLAYLISTS]:
+                del playlists[key]
+        
+        serialized = json.dumps(stats)
+    
+    # Write outside the lock, replacing the file atomically so readers never see a partial write
+    tmp_path = f'{SCRAPE_STATS_PATH}.tmp-{os.getpid()}-{threading.get_ident()}'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(serialized)
+        os.replace(tmp_path, SCRAPE_STATS_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass  # Stats still live in memory
+    
+    log_message(f"📊 Recorded {playlist_class} scrape: {track_count} tracks, stable after {stable_seconds:.1f}s / {scrolls} scrolls")
+
+def get_scrape_profile(playlist_id):
+    """Pick expected size, scroll budget and waits for a playlist from previous scrapes"""
+    playlist_class, fixed_size = classify_playlist(playlist_id) if playlist_id else ('user', None)
+    profile = {
+        'playlist_class': playlist_class,
+        'source': 'default',
+        'expected_tracks': fixed_size,
+        'confirm_expected': False,
+        'max_scroll_attempts': DEFAULT_MAX_SCROLL_ATTEMPTS,
+        'scroll_pause': DEFAULT_SCROLL_PAUSE,
+        'settle_wait': DEFAULT_SETTLE_WAIT,
+        'scroll_time_budget': DEFAULT_SCROLL_TIME_BUDGET
+    }
+    
+    with _scrape_stats_lock:
+        stats = load_scrape_stats()
+        playlist_entry = stats['playlists'].get(playlist_id) if playlist_id else None
+        class_entry = stats['classes'].get(playlist_class)
+        entry = playlist_entry or class_entry
+        entry = dict(entry) if entry else None
+    
+    if not entry:
+        return profile
+    
+    profile['source'] = 'playlist' if playlist_entry else 'class'
+    
+    if playlist_entry:
+        # User playlists can grow, so reaching the last size only triggers a quick confirm
+        profile['expected_tracks'] = entry['max_tracks']
+        profile['confirm_expected'] = fixed_size is None
+    elif fixed_size:
+        profile['expected_tracks'] = int(round(entry['tracks']))
+    
+    scrolls_needed = math.ceil(entry['scrolls'] * 1.5) + 2
+    if entry.get('truncated'):
+        scrolls_needed = max(scrolls_needed, math.ceil(entry['scrolls']) * 2)
+    if fixed_size or playlist_entry:
+        profile['max_scroll_attempts'] = min(max(scrolls_needed, 3), MAX_SCROLL_ATTEMPTS_CAP)
+    else:
+        profile['max_scroll_attempts'] = min(max(scrolls_needed, DEFAULT_MAX_SCROLL_ATTEMPTS), MAX_SCROLL_ATTEMPTS_CAP)
+    
+    # Load latency is timed from the start of a scroll, so the poll window after the
+    # scroll strategies only needs to cover whatever is left of it (with some slack)
+    if entry.get('load_latency') is not None:
+        remaining = entry['load_latency'] * 1.5 - 4 * DEFAULT_SCROLL_PAUSE
+        profile['settle_wait'] = min(max(remaining, 1.0), 4.0)
+    
+    # Allow well beyond the usual time-to-stable before giving up on a still-loading list
+    profile['scroll_time_budget'] = round(min(max(entry['stable_seconds'] * 3, MIN_SCROLL_TIME_BUDGET), DEFAULT_SCROLL_TIME_BUDGET), 1)
+    
+    return profile
+
+def count_track_elements(driver):
+    """Count track rows currently rendered, taking the best of several selectors"""
+    track_count_scripts = [
+        "return document.querySelectorAll('[data-uri*=\"spotify:track:\"]').length;",
+        "return document.querySelectorAll('[data-testid=\"tracklist-row\"]').length;",
+        "return document.querySelectorAll('.tracklist-row').length;",
+        "return document.querySelectorAll('[role=\"row\"]').length;"
+    ]
+    
+    current_tracks = 0
+    for script in track_count_scripts:
+        try:
+            count = driver.execute_script(script)
+            current_tracks = max(current_tracks, count)
+        except:
+            continue
+    return current_tracks
+
+def extract_tracks_from_page(driver, playlist_id=None, profile=None):
+    """Extract track URIs from loaded Spotify page with adaptive scrolling"""
     log_message("🔍 Extracting tracks from loaded page...")
     
-    # Scroll down to load all tracks (Song Radio has 50 tracks)
-    log_message("📜 Scrolling to load all tracks...")
-    last_track_count = 0
+    if profile is None:
+        profile = get_scrape_profile(playlist_id)
+    expected_tracks = profile['expected_tracks']
+    max_scroll_attempts = profile['max_scroll_attempts']
+    scroll_pause = profile['scroll_pause']
+    settle_wait = profile['settle_wait']
+    scroll_time_budget = profile['scroll_time_budget']
+    
+    log_message(f"📜 Scrolling to load all tracks ({profile['playlist_class']} profile from {profile['source']}: "
+                f"expect {expected_tracks or '?'} tracks, up to {max_scroll_attempts} scrolls, {settle_wait:.2f}s settle)...")
+    
+    scroll_strategies = [
+        "window.scrollTo(0, document.body.scrollHeight);",
+        "window.scrollBy(0, 1000);",
+        "document.body.scrollTop = document.body.scrollHeight;",
+        "document.documentElement.scrollTop = document.documentElement.scrollHeight;"
+    ]
+    
+    started = time.monotonic()
+    stable_at = started
+    last_track_count = count_track_elements(driver)
     scroll_attempts = 0
-    max_scroll_attempts = 15  # Increased for reliability
-    
-    while scroll_attempts < max_scroll_attempts:
-        # Multiple scroll strategies
-        scroll_strategies = [
-            "window.scrollTo(0, document.body.scrollHeight);",
-            "window.scrollBy(0, 1000);",
-            "document.body.scrollTop = document.body.scrollHeight;",
-            "document.documentElement.scrollTop = document.documentElement.scrollHeight;"
-        ]
+    still_growing = True
+    finished = False
+    confirming = False
+    extended = False
+    latencies = []
+    
+    if expected_tracks and not profile['confirm_expected'] and last_track_count >= expected_tracks:
+        log_message(f"   Already showing {last_track_count} tracks, expected {expected_tracks}, skipping scroll")
+        finished = True
+    
+    while not finished:
+        # Stay inside the time budget so the extraction timeout never throws the tracks away
+        if time.monotonic() - started >= scroll_time_budget or scrape_cancelled():
+            break
+        
+        # Past the usual budget, keep going only while the last scroll still added tracks
+        if scroll_attempts >= max_scroll_attempts:
+            if not still_growing or scroll_attempts >= MAX_SCROLL_ATTEMPTS_CAP:
+                break
+            if not extended:
+                log_message(f"   Tracks still loading after {scroll_attempts} scrolls, extending scroll budget")
+                extended = True
         
+        scroll_started = time.monotonic()
         for strategy in scroll_strategies:
             try:
                 driver.execute_script(strategy)
-                time.sleep(0.5)
+                time.sleep(scroll_pause)
             except:
                 continue
         
-        time.sleep(2)  # Wait for tracks to load
-        
-        # Count current tracks with multiple methods
-        track_count_scripts = [
-            "return document.querySelectorAll('[data-uri*=\"spotify:track:\"]').length;",
-            "return document.querySelectorAll('[data-testid=\"tracklist-row\"]').length;",
-            "return document.querySelectorAll('.tracklist-row').length;",
-            "return document.querySelectorAll('[role=\"row\"]').length;"
-        ]
+        # Poll for new tracks instead of sleeping the whole settle window
+        if confirming:
+            window = max(scroll_pause, settle_wait / 2)
+        elif expected_tracks and last_track_count < expected_tracks:
+            # Short of the expected size, never give up on less than the default window
+            window = max(settle_wait, DEFAULT_SETTLE_WAIT)
+        else:
+            window = settle_wait
+        deadline = time.monotonic() + window
+        current_tracks = count_track_elements(driver)
+        while current_tracks <= last_track_count and time.monotonic() < deadline:
+            time.sleep(0.25)
+            current_tracks = count_track_elements(driver)
         
-        current_tracks = 0
-        for script in track_count_scripts:
-            try:
-                count = driver.execute_script(script)
-                current_tracks = max(current_tracks, count)
-            except:
-                continue
+        scroll_attempts += 1
+        log_message(f"   Scroll {scroll_attempts}: Found {current_tracks} track elements")
         
-        log_message(f"   Scroll {scroll_attempts + 1}: Found {current_tracks} track elements")
+        if current_tracks > last_track_count:
+            latencies.append(time.monotonic() - scroll_started)
+            stable_at = time.monotonic()
+            still_growing = True
+        else:
+            still_growing = False
         
         # If no new tracks loaded, we're done
-        if current_tracks == last_track_count and current_tracks > 0:
+        if not still_growing and current_tracks > 0:
             log_message(f"   No new tracks loaded, stopping scroll")
+            finished = True
             break
-            
+        
         last_track_count = current_tracks
-        scroll_attempts += 1
         
-        # If we have 50+ tracks (Song Radio limit), we're probably done
-        if current_tracks >= 50:
-            log_message(f"   Found {current_tracks} tracks, likely all loaded")
-            break
+        if expected_tracks and current_tracks >= expected_tracks:
+            if not profile['confirm_expected']:
+                log_message(f"   Found {current_tracks} tracks, expected {expected_tracks}, stopping scroll")
+                finished = True
+                break
+            if confirming:
+                # The confirm scroll added rows, so the playlist has grown past its last
+                # known size; go back to full settle windows and stop only once stable
+                log_message(f"   Playlist grew past {expected_tracks} tracks, continuing with full waits")
+                confirming = False
+                expected_tracks = None
+            else:
+                confirming = True
     
+    truncated = not finished and still_growing
+    if truncated:
+        log_message(f"⚠️ Scroll limit reached after {scroll_attempts} scrolls while tracks were still loading")
     log_message(f"🎯 Finished scrolling, found {last_track_count} total track elements")
     
     # Comprehensive JavaScript extraction with multiple methods
@@ -411,11 +913,184 @@ def extract_tracks_from_page(driver):
     try:
         tracks = driver.execute_script(js_extract)
         log_message(f"🎵 JavaScript extraction found {len(tracks) if tracks else 0} unique tracks")
+        if tracks and not scrape_cancelled():
+            record_scrape_observation(
+                playlist_id, len(tracks), stable_at - started, scroll_attempts,
+                sum(latencies) / len(latencies) if latencies else None, truncated
+            )
         return tracks or []
     except Exception as e:
         log_message(f"❌ JavaScript extraction failed: {e}")
         return []
 
+def normalize_track_uris(tracks):
+    """Validate track URIs and remove duplicates, keeping first-seen order"""
+    unique_tracks = []
+    seen = set()
+    for track in tracks:
+        if track and track.startswith('spotify:track:'):
+            track_parts = track.split(':')
+            if len(track_parts) == 3 and len(track_parts[2]) == 22:
+                if track not in seen:
+                    seen.add(track)
+                    unique_tracks.append(track)
+    return unique_tracks
+
+# Spotify Web API tier, tried before launching any browser
+SPOTIFY_CLIENT_ID = os.environ.get('SPOTIFY_CLIENT_ID')
+SPOTIFY_CLIENT_SECRET = os.environ.get('SPOTIFY_CLIENT_SECRET')
+SPOTIFY_API_BASE = os.environ.get('SPOTIFY_API_BASE', 'https://api.spotify.com/v1').rstrip('/')
+SPOTIFY_TOKEN_URL = os.environ.get('SPOTIFY_TOKEN_URL', 'https://accounts.spotify.com/api/token')
+API_PAGE_SIZE = 100  # Maximum the playlist tracks endpoint allows
+API_CONCURRENCY = int(os.environ.get('API_CONCURRENCY', 8))
+API_TIMEOUT = (5, 15)  # Connect, read seconds
+API_TOKEN_REFRESH_MARGIN = 60  # Refresh the token this long before it expires
+
+_api_session = None
+_api_token = {'access_token': None, 'expires_at': 0}
+_api_lock = threading.Lock()
+
+class SpotifyAPIError(Exception):
+    """Web API request failure carrying the HTTP status code"""
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+def api_tier_enabled():
+    """Return True if client credentials for the Web API tier are configured"""
+    return bool(SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET)
+
+def get_api_session():
+    """Return the shared, connection-pooled HTTP session for Web API calls"""
+    global _api_session
+    if _api_session is None:
+        with _api_lock:
+            if _api_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=API_CONCURRENCY)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _api_session = session
+    return _api_session
+
+def get_api_token(force_refresh=False):
+    """Return a client-credentials access token, reusing it until shortly before expiry"""
+    with _api_lock:
+        if not force_refresh and _api_token['access_token'] and time.time() < _api_token['expires_at']:
+            return _api_token['access_token']
+    
+    response = get_api_session().post(
+        SPOTIFY_TOKEN_URL,
+        data={'grant_type': 'client_credentials'},
+        auth=(SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET),
+        timeout=API_TIMEOUT
+    )
+    if response.status_code != 200:
+        raise SpotifyAPIError(f"Token request failed: {response.status_code} {response.text[:200]}", response.status_code)
+    
+    data = response.json()
+    with _api_lock:
+        _api_token['access_token'] = data['access_token']
+        _api_token['expires_at'] = time.time() + data.get('expires_in', 3600) - API_TOKEN_REFRESH_MARGIN
+    log_message("🔑 Obtained Spotify API token")
+    return data['access_token']
+
+def fetch_api_page(playlist_id, offset):
+    """Fetch one page of playlist items, refreshing the token or honouring Retry-After once"""
+    url = f"{SPOTIFY_API_BASE}/playlists/{playlist_id}/tracks"
+    params = {
+        'offset': offset,
+        'limit': API_PAGE_SIZE,
+        'fields': 'total,items(track(uri))',
+        'additional_types': 'track'
+    }
+    
+    token = get_api_token()
+    for attempt in range(2):
+        response = get_api_session().get(
+            url, params=params, headers={'Authorization': f'Bearer {token}'}, timeout=API_TIMEOUT
+        )
+        if response.status_code == 200:
+            return response.json()
+        if attempt == 0 and response.status_code == 401:
+            token = get_api_token(force_refresh=True)
+            continue
+        if attempt == 0 and response.status_code == 429:
+            time.sleep(min(int(response.headers.get('Retry-After', 1)), 10))
+            continue
+        break
+    
+    raise SpotifyAPIError(f"API page at offset {offset} failed: {response.status_code} {response.text[:200]}", response.status_code)
+
+def _page_track_uris(page):
+    """Pull track URIs out of a page, skipping episodes, local files and removed tracks"""
+    uris = []
+    for item in page.get('items') or []:
+        track = item.get('track') or {}
+        uri = track.get('uri') or ''
+        if uri.startswith('spotify:track:'):
+            uris.append(uri)
+    return uris
+
+def fetch_tracks_via_api(playlist_id):
+    """Fetch all playlist track URIs via the Web API; None means this tier can't, [] means an empty playlist"""
+    if not api_tier_enabled():
+        return None
+    
+    playlist_class, _ = classify_playlist(playlist_id)
+    strategy_name = f'api:{playlist_class}'
+    if not select_strategies([strategy_name]) or not begin_strategy(strategy_name):
+        return None
+    
+    started = time.monotonic()
+    try:
+        log_message(f"🌐 Fetching {playlist_id} via Web API...")
+        first_page = fetch_api_page(playlist_id, 0)
+        total = first_page.get('total') or 0
+        offsets = list(range(API_PAGE_SIZE, total, API_PAGE_SIZE))
+        
+        # Fetch every remaining page at once; results are reassembled in offset order
+        pages = [first_page]
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(API_CONCURRENCY, len(offsets))) as executor:
+                pages.extend(executor.map(lambda offset: fetch_api_page(playlist_id, offset), offsets))
+        
+        tracks = []
+        for page in pages:
+            tracks.extend(_page_track_uris(page))
+        # Same validation and de-duplication as the browser tier, so both agree
+        tracks = normalize_track_uris(tracks)
+        
+        elapsed = time.monotonic() - started
+        record_strategy_result(strategy_name, True, elapsed)
+        log_message(f"🌐 Web API returned {len(tracks)} tracks ({total} items, {len(pages)} pages) in {elapsed:.2f}s")
+        return tracks
+    except Exception as e:
+        # 403/404 on a user playlist means the API answered but this playlist is private or gone
+        api_healthy = playlist_class == 'user' and getattr(e, 'status_code', None) in (403, 404)
+        record_strategy_result(strategy_name, api_healthy, time.monotonic() - started)
+        log_message(f"❌ Web API tier failed: {str(e)[:200]}")
+        return None
+
+class BrowsersUnavailableError(Exception):
+    """Every browser strategy is behind an open circuit breaker"""
+
+class ScrapeCancelledError(Exception):
+    """The scrape was cancelled by the warmer after overrunning its budget"""
+
+# Drivers and cancellations per thread, so the warmer can stop a scrape that overruns its budget
+_active_drivers = {}
+_cancelled_scrapes = set()
+_active_drivers_lock = threading.Lock()
+
+def scrape_cancelled():
+    """Return True if the current thread's scrape has been cancelled"""
+    with _active_drivers_lock:
+        return threading.get_ident() in _cancelled_scrapes
+
 def scrape_with_headless_browser(playlist_id):
     """Use headless browser to scrape Spotify playlist with robust multi-browser support"""
     playlist_url = f"https://open.spotify.com/playlist/{playlist_id}"
@@ -434,19 +1109,43 @@ def scrape_with_headless_browser(playlist_id):
     driver = None
     tracks = []
     
+    # Size the scroll budget and extraction timeout from previous scrapes
+    profile = get_scrape_profile(playlist_id)
+    extraction_timeout = int(min(profile['scroll_time_budget'] + 60, 240))
+    
     # Try browsers in order of preference
-    browsers = [
-        ('Chrome/Chromium', setup_chrome_driver),
-        ('Firefox', setup_firefox_driver)
-    ]
+    browsers = {
+        'browser:chrome': ('Chrome/Chromium', 'chrome', setup_chrome_driver),
+        'browser:firefox': ('Firefox', 'firefox', setup_firefox_driver)
+    }
+    
+    # Order by expected time-to-success, skipping browsers whose circuit is open
+    strategies = select_strategies(list(browsers))
+    if not strategies:
+        raise BrowsersUnavailableError("All browsers are failing, retrying after the circuit breaker cooldown")
     
-    for browser_name, setup_func in browsers:
+    attempted = False
+    for strategy_name in strategies:
+        # A cancelled scrape must not go on to launch the next browser
+        if scrape_cancelled():
+            break
+        
+        if not begin_strategy(strategy_name):
+            continue
+        attempted = True
+        
+        browser_name, browser_key, setup_func = browsers[strategy_name]
+        profile_dir = acquire_browser_profile(browser_key)
+        started = time.monotonic()
+        browser_ok = False
         try:
             log_message(f"🔧 Trying {browser_name} headless browser...")
             
             # Use timeout handler for driver creation
             with timeout_handler(60):  # 60 second timeout for driver setup
-                driver = setup_func()
+                driver = setup_func(profile_dir)
+            with _active_drivers_lock:
+                _active_drivers[threading.get_ident()] = driver
             
             log_message(f"📡 Loading playlist page with {browser_name}...")
             
@@ -487,8 +1186,11 @@ def scrape_with_headless_browser(playlist_id):
             
             # Extract tracks using JavaScript with timeout
             log_message(f"🎵 Extracting tracks with {browser_name}...")
-            with timeout_handler(60):  # 60 second timeout for extraction
-                tracks = extract_tracks_from_page(driver)
+            with timeout_handler(extraction_timeout):
+                tracks = extract_tracks_from_page(driver, playlist_id, profile)
+            
+            # The browser worked even if the playlist itself is empty, private or invalid
+            browser_ok = True
             
             if tracks and len(tracks) > 0:
                 log_message(f"🎵 Successfully extracted {len(tracks)} tracks with {browser_name}")
@@ -506,6 +1208,8 @@ def scrape_with_headless_browser(playlist_id):
             log_message(f"❌ {browser_name} failed: {str(e)[:200]}")
             continue
         finally:
+            with _active_drivers_lock:
+                _active_drivers.pop(threading.get_ident(), None)
             if driver:
                 try:
                     with timeout_handler(10):  # 10 second timeout for cleanup
@@ -514,22 +1218,278 @@ def scrape_with_headless_browser(playlist_id):
                     log_message("⚠️ Driver cleanup failed")
                     pass
                 driver = None
+            cancelled = scrape_cancelled()
+            release_browser_profile(browser_key, profile_dir, promote=bool(tracks) and not cancelled)
+            # Errors caused by the warmer quitting the driver say nothing about the browser
+            if cancelled:
+                release_strategy(strategy_name)
+            else:
+                record_strategy_result(strategy_name, browser_ok, time.monotonic() - started)
+    
+    if scrape_cancelled():
+        raise ScrapeCancelledError(f"Scrape of {playlist_id} was cancelled")
+    
+    if not attempted:
+        raise BrowsersUnavailableError("All browsers are failing, retrying after the circuit breaker cooldown")
     
     if not tracks:
         raise Exception("All browser attempts failed to extract tracks")
     
-    # Remove duplicates and validate track URIs
-    unique_tracks = []
-    for track in tracks:
-        if track and track.startswith('spotify:track:'):
-            track_parts = track.split(':')
-            if len(track_parts) == 3 and len(track_parts[2]) == 22:
-                if track not in unique_tracks:
-                    unique_tracks.append(track)
-    
+    unique_tracks = normalize_track_uris(tracks)
     log_message(f"✅ Final result: {len(unique_tracks)} valid unique tracks")
     return unique_tracks
 
+# Scrape result cache and refresh-ahead warmer for frequently requested playlists
+SCRAPE_CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', 3600))
+SCRAPE_CACHE_MAX_ENTRIES = int(os.environ.get('SCRAPE_CACHE_MAX_ENTRIES', 256))
+REQUEST_SCORE_HALF_LIFE = 3600  # Seconds for a playlist's request score to halve
+
+WARMER_ENABLED = os.environ.get('WARMER_ENABLED', '1') != '0'
+WARMER_INTERVAL = int(os.environ.get('WARMER_INTERVAL', 60))
+WARMER_REFRESH_AHEAD = int(os.environ.get('WARMER_REFRESH_AHEAD', 300))  # Refresh this long before expiry
+WARMER_MIN_SCORE = float(os.environ.get('WARMER_MIN_SCORE', 2))
+WARMER_CONCURRENCY = int(os.environ.get('WARMER_CONCURRENCY', 1))
+WARMER_BUDGET_SECONDS = int(os.environ.get('WARMER_BUDGET_SECONDS', 180))  # Per warm cycle
+WARMER_BUSY_REQUESTS_PER_MINUTE = int(os.environ.get('WARMER_BUSY_REQUESTS_PER_MINUTE', 6))
+WARMER_MAX_BACKOFF = 600
+WARMER_FAILURE_BACKOFF_MAX = 6 * 3600  # Longest a playlist is skipped after repeated failed warms
+WARMER_ABANDON_GRACE = 10  # Seconds to let a timed-out warm scrape unwind after its driver is quit
+
+_scrape_cache = {}
+_request_scores = {}
+_recent_requests = []
+_scrapes_in_progress = set()
+_warm_failures = {}  # playlist_id -> (consecutive failures, retry not before)
+_warm_threads = {}  # playlist_id -> thread ident running its warm scrape
+_abandoned_warms = []  # Warm futures that overran the budget and may still be unwinding
+_live_scrapes = 0
+_scrape_cache_lock = threading.Lock()
+_warmer_thread = None
+
+def get_cached_tracks(playlist_id):
+    """Return a fresh cached scrape result for a playlist, or None"""
+    with _scrape_cache_lock:
+        entry = _scrape_cache.get(playlist_id)
+        if entry and entry['expires_at'] > time.time():
+            return entry
+    return None
+
+def store_cached_tracks(playlist_id, tracks):
+    """Cache a scrape result, evicting the entries closest to expiry when full"""
+    now = time.time()
+    with _scrape_cache_lock:
+        _scrape_cache[playlist_id] = {
+            'tracks': tracks,
+            'fetched_at': now,
+            'expires_at': now + SCRAPE_CACHE_TTL
+        }
+        while len(_scrape_cache) > SCRAPE_CACHE_MAX_ENTRIES:
+            oldest = min(_scrape_cache, key=lambda key: _scrape_cache[key]['expires_at'])
+            del _scrape_cache[oldest]
+
+def record_playlist_request(playlist_id):
+    """Bump a playlist's exponentially decayed request score and the live traffic window"""
+    now = time.time()
+    with _scrape_cache_lock:
+        score, last_seen = _request_scores.get(playlist_id, (0.0, now))
+        decay = 0.5 ** ((now - last_seen) / REQUEST_SCORE_HALF_LIFE)
+        _request_scores[playlist_id] = (score * decay + 1, now)
+        
+        _recent_requests.append(now)
+        while _recent_requests and _recent_requests[0] < now - 60:
+            _recent_requests.pop(0)
+
+def run_scrape(playlist_id, live=True, use_browser=True):
+    """Fetch a playlist via the Web API or a browser, tracking in-flight work and caching the result"""
+    global _live_scrapes
+    with _scrape_cache_lock:
+        _scrapes_in_progress.add(playlist_id)
+        if live:
+            _live_scrapes += 1
+    
+    try:
+        tracks = fetch_tracks_via_api(playlist_id)
+        source = 'api'
+        if tracks is None:
+            if not use_browser:
+                raise Exception("Web API tier failed and no browsers are available")
+            tracks = scrape_with_headless_browser(playlist_id)
+            source = 'browser'
+        store_cached_tracks(playlist_id, tracks)
+        return tracks, source
+    finally:
+        with _scrape_cache_lock:
+            _scrapes_in_progress.discard(playlist_id)
+            if live:
+                _live_scrapes -= 1
+
+def warmer_is_busy():
+    """Return True when live traffic is high enough that warming should back off"""
+    with _scrape_cache_lock:
+        cutoff = time.time() - 60
+        recent = sum(1 for ts in _recent_requests if ts >= cutoff)
+        return _live_scrapes > 0 or recent >= WARMER_BUSY_REQUESTS_PER_MINUTE
+
+def get_warm_candidates():
+    """Return hot playlist IDs whose cached result is about to go stale, hottest first"""
+    now = time.time()
+    candidates = []
+    with _scrape_cache_lock:
+        for playlist_id, (score, last_seen) in _request_scores.items():
+            score *= 0.5 ** ((now - last_seen) / REQUEST_SCORE_HALF_LIFE)
+            entry = _scrape_cache.get(playlist_id)
+            if score < WARMER_MIN_SCORE or playlist_id in _scrapes_in_progress:
+                continue
+            # Only refresh results we already have; failed scrapes never get an entry
+            if not entry or entry['expires_at'] - now > WARMER_REFRESH_AHEAD:
+                continue
+            failures = _warm_failures.get(playlist_id)
+            if failures and failures[1] > now:
+                continue
+            candidates.append((score, playlist_id))
+        
+        # Forget playlists that have cooled off completely
+        for playlist_id in [key for key, (score, last_seen) in _request_scores.items()
+                            if score * 0.5 ** ((now - last_seen) / REQUEST_SCORE_HALF_LIFE) < 0.1]:
+            del _request_scores[playlist_id]
+            _warm_failures.pop(playlist_id, None)
+    
+    candidates.sort(reverse=True)
+    return [playlist_id for _, playlist_id in candidates]
+
+def _warm_one(playlist_id):
+    """Run one warm scrape, remembering which thread runs it so it can be cut short"""
+    with _active_drivers_lock:
+        _warm_threads[playlist_id] = threading.get_ident()
+    try:
+        return run_scrape(playlist_id, live=False)
+    finally:
+        with _active_drivers_lock:
+            _warm_threads.pop(playlist_id, None)
+            _cancelled_scrapes.discard(threading.get_ident())
+
+def _cancel_warm(playlist_id):
+    """Cancel a running warm scrape and quit its driver, unblocking any Selenium call it is stuck in"""
+    with _active_drivers_lock:
+        thread_id = _warm_threads.get(playlist_id)
+        if not thread_id:
+            return
+        _cancelled_scrapes.add(thread_id)
+        driver = _active_drivers.pop(thread_id, None)
+    
+    if driver:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+def warm_cycle():
+    """Refresh hot playlists within the configured concurrency and time budget"""
+    # Don't pile new work on top of scrapes still unwinding from an earlier overrun
+    _abandoned_warms[:] = [future for future in _abandoned_warms if not future.done()]
+    if _abandoned_warms:
+        log_message(f"🔥 {len(_abandoned_warms)} overrun warm scrapes still unwinding, skipping cycle")
+        return 0
+    
+    candidates = get_warm_candidates()
+    if not candidates:
+        return 0
+    
+    log_message(f"🔥 Warmer refreshing up to {len(candidates)} hot playlists...")
+    deadline = time.monotonic() + WARMER_BUDGET_SECONDS
+    refreshed = 0
+    executor = ThreadPoolExecutor(max_workers=WARMER_CONCURRENCY)
+    pending = {}
+    
+    try:
+        for playlist_id in candidates:
+            # Don't start new work past the budget or once live traffic picks up
+            while len(pending) >= WARMER_CONCURRENCY and time.monotonic() < deadline:
+                done, _ = wait(pending, timeout=deadline - time.monotonic(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    refreshed += _finish_warm(pending.pop(future), future)
+            if time.monotonic() >= deadline or warmer_is_busy():
+                log_message("🔥 Warmer stopping early (budget spent or live traffic)")
+                break
+            pending[executor.submit(_warm_one, playlist_id)] = playlist_id
+        
+        # The budget also bounds work already running
+        done, overrun = wait(pending, timeout=max(deadline - time.monotonic(), 0))
+        for future in done:
+            refreshed += _finish_warm(pending.pop(future), future)
+        
+        for future in overrun:
+            playlist_id = pending[future]
+            log_message(f"⏰ Warming {playlist_id} overran the {WARMER_BUDGET_SECONDS}s budget, cancelling it")
+            _cancel_warm(playlist_id)
+        
+        if overrun:
+            done, still_running = wait(overrun, timeout=WARMER_ABANDON_GRACE)
+            for future in done:
+                refreshed += _finish_warm(pending.pop(future), future)
+            for future in still_running:
+                _record_warm_failure(pending[future])
+                _abandoned_warms.append(future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return refreshed
+
+def _record_warm_failure(playlist_id):
+    """Back off exponentially before warming a playlist that just failed again"""
+    with _scrape_cache_lock:
+        count = _warm_failures.get(playlist_id, (0, 0))[0] + 1
+        delay = min(WARMER_INTERVAL * 2 ** count, WARMER_FAILURE_BACKOFF_MAX)
+        _warm_failures[playlist_id] = (count, time.time() + delay)
+    log_message(f"🔥 Not warming {playlist_id} again for {delay}s after {count} failures")
+
+def _finish_warm(playlist_id, future):
+    """Log the outcome of one warm scrape, returning 1 on success"""
+    try:
+        tracks, source = future.result()
+        with _scrape_cache_lock:
+            _warm_failures.pop(playlist_id, None)
+        log_message(f"🔥 Warmed {playlist_id} via {source}: {len(tracks)} tracks")
+        return 1
+    except Exception as e:
+        log_message(f"🔥 Warming {playlist_id} failed: {str(e)[:200]}")
+        _record_warm_failure(playlist_id)
+        return 0
+
+def warmer_loop():
+    """Background loop that runs warm cycles at low priority, backing off under load"""
+    try:
+        os.nice(10)  # Per-thread on Linux, and inherited by the browsers we launch
+    except (AttributeError, OSError):
+        pass
+    
+    delay = WARMER_INTERVAL
+    while True:
+        time.sleep(delay)
+        try:
+            if warmer_is_busy():
+                delay = min(delay * 2, WARMER_MAX_BACKOFF)
+                log_message(f"🔥 Live traffic is high, warmer backing off for {delay}s")
+                continue
+            warm_cycle()
+            delay = WARMER_INTERVAL
+        except Exception as e:
+            log_message(f"❌ Warmer cycle failed: {e}")
+            delay = min(delay * 2, WARMER_MAX_BACKOFF)
+
+def start_warmer():
+    """Start the refresh-ahead warmer thread once per process"""
+    global _warmer_thread
+    if not WARMER_ENABLED or (_warmer_thread and _warmer_thread.is_alive()):
+        return
+    
+    with _scrape_cache_lock:
+        if _warmer_thread and _warmer_thread.is_alive():
+            return
+        _warmer_thread = threading.Thread(target=warmer_loop, name='scrape-warmer', daemon=True)
+        _warmer_thread.start()
+    log_message(f"🔥 Refresh-ahead warmer started (interval {WARMER_INTERVAL}s, concurrency {WARMER_CONCURRENCY})")
+
 @app.route('/health')
 def health_check():
     """Health check endpoint with browser availability"""
@@ -541,6 +1501,13 @@ def health_check():
         'status': 'healthy',
         'message': 'Headless browser scraper running',
         'browser_availability': availability,
+        'scrape_cache': {
+            'entries': len(_scrape_cache),
+            'tracked_playlists': len(_request_scores),
+            'warmer_running': bool(_warmer_thread and _warmer_thread.is_alive())
+        },
+        'api_tier_enabled': api_tier_enabled(),
+        'strategies': get_strategy_summary(),
         'timestamp': str(datetime.now())
     })
 
@@ -660,8 +1627,26 @@ def scrape_playlist():
         playlist_id = extract_playlist_id(playlist_url)
         log_message(f"📝 Extracted playlist ID: {playlist_id}")
         
+        record_playlist_request(playlist_id)
+        start_warmer()
+        
         # Check browser availability before attempting scrape
         availability = check_browser_availability()
+        
+        cached = get_cached_tracks(playlist_id)
+        if cached:
+            log_message(f"⚡ Serving cached result for {playlist_id} ({len(cached['tracks'])} tracks)")
+            return jsonify({
+                'success': True,
+                'playlist_id': playlist_id,
+                'tracks': cached['tracks'],
+                'count': len(cached['tracks']),
+                'cached': True,
+                'cached_at': str(datetime.fromtimestamp(cached['fetched_at'])),
+                'browser_availability': availability,
+                'timestamp': str(datetime.now())
+            })
+        
         log_message(f"🔍 Browser availability: {availability}")
         
         has_browser = (
@@ -669,33 +1654,38 @@ def scrape_playlist():
             any(availability['drivers'].values())
         )
         
-        if not has_browser:
+        if not has_browser and not api_tier_enabled():
             log_message("❌ No browsers or drivers available")
             return jsonify({
                 'error': 'No browsers available for scraping',
                 'browser_availability': availability
             }), 503
         
-        # Use headless browser to scrape with timeout
+        # Try the Web API tier, then the headless browser, with timeout
         log_message("🚀 Starting scraping process...")
         with timeout_handler(300):  # 5 minute timeout for entire scrape process
-            tracks = scrape_with_headless_browser(playlist_id)
+            tracks, source = run_scrape(playlist_id, use_browser=has_browser)
         
         result = {
             'success': True,
             'playlist_id': playlist_id,
             'tracks': tracks,
             'count': len(tracks),
+            'cached': False,
+            'source': source,
             'browser_availability': availability,
             'timestamp': str(datetime.now())
         }
         
-        log_message(f"✅ Headless browser scraping completed: {len(tracks)} tracks")
+        log_message(f"✅ Scraping completed via {source}: {len(tracks)} tracks")
         return jsonify(result)
         
     except ValueError as e:
         log_message(f"❌ Invalid URL: {e}")
         return jsonify({'error': f'Invalid playlist URL: {str(e)}'}), 400
+    except BrowsersUnavailableError as e:
+        log_message(f"🚫 {e}")
+        return jsonify({'error': str(e)}), 503
     except TimeoutError as e:
         log_message(f"⏰ Scraping timed out: {e}")
         return jsonify({'error': f'Scraping timed out: {str(e)}'}), 504
@@ -703,17 +1693,91 @@ def scrape_playlist():
         log_message(f"❌ Headless browser error: {e}")
         return jsonify({'error': f'Headless browser error: {str(e)}'}), 500
 
-@app.route('/')
-def serve_frontend():
-    """Serve the frontend"""
+# Static frontend assets, held in memory with precompressed variants
+FRONTEND_PATH = 'index.html'
+STATIC_CACHE_CONTROL = 'no-cache'  # Always revalidate, repeat visits cost a 304
+STATIC_MIN_COMPRESS_SIZE = 512  # Not worth compressing tiny bodies
+
+_static_assets = {}
+_static_assets_lock = threading.Lock()
+
+def _build_static_asset(body, mimetype, stat_key=None):
+    """Build an in-memory asset with identity/gzip/brotli variants and strong ETags"""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    variants = {'identity': (body, f'"{digest}"')}
+    
+    if len(body) >= STATIC_MIN_COMPRESS_SIZE:
+        gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(gzipped) < len(body):
+            variants['gzip'] = (gzipped, f'"{digest}-gz"')
+        
+        try:
+            import brotli
+            compressed = brotli.compress(body, quality=11)
+            if len(compressed) < len(body):
+                variants['br'] = (compressed, f'"{digest}-br"')
+        except ImportError:
+            pass  # brotli is optional, gzip still covers most clients
+    
+    return {
+        'mimetype': mimetype,
+        'variants': variants,
+        'stat_key': stat_key
+    }
+
+def load_static_asset(path, mimetype='text/html'):
+    """Return the cached asset for path, reloading it only if the file changed on disk"""
     try:
-        if os.path.exists('index.html'):
-            with open('index.html', 'r', encoding='utf-8') as f:
-                return f.read()
-    except Exception as e:
-        log_message(f"❌ Error serving frontend: {e}")
+        st = os.stat(path)
+    except OSError:
+        return None
+    
+    stat_key = (st.st_mtime_ns, st.st_size)
+    asset = _static_assets.get(path)
+    if asset and asset['stat_key'] == stat_key:
+        return asset
+    
+    with _static_assets_lock:
+        asset = _static_assets.get(path)
+        if asset and asset['stat_key'] == stat_key:
+            return asset
+        
+        with open(path, 'rb') as f:
+            body = f.read()
+        
+        asset = _build_static_asset(body, mimetype, stat_key)
+        _static_assets[path] = asset
+        sizes = ', '.join(f"{name}={len(data)}B" for name, (data, _) in asset['variants'].items())
+        log_message(f"📦 Loaded static asset {path} ({sizes})")
+        return asset
+
+def serve_static_asset(asset):
+    """Serve a cached asset, negotiating encoding and answering conditional requests"""
+    variants = asset['variants']
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in variants and request.accept_encodings[candidate] > 0:
+            encoding = candidate
+            break
+    
+    body, etag = variants[encoding]
+    headers = {
+        'ETag': etag,
+        'Cache-Control': STATIC_CACHE_CONTROL,
+        'Vary': 'Accept-Encoding'
+    }
+    
+    # If-None-Match uses weak comparison, so W/ validators from intermediaries still match
+    if request.if_none_match.contains_weak(etag.strip('"')):
+        return Response(status=304, headers=headers)
     
-    # Fallback HTML
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    
+    return Response(body, mimetype=asset['mimetype'], headers=headers)
+
+def render_fallback_page():
+    """Render the fallback HTML shown when the frontend file is missing"""
     return f"""
     <!DOCTYPE html>
     <html>
@@ -731,7 +1795,7 @@ def serve_frontend():
             <h1>🚀 Spotify Headless Browser Scraper</h1>
             <div class="status">
                 <p><strong>Backend is running!</strong></p>
-                <p>Timestamp: {datetime.now()}</p>
+                <p>Started: {SERVER_STARTED_AT}</p>
             </div>
             
             <h2>Available Endpoints:</h2>
@@ -742,13 +1806,43 @@ def serve_frontend():
                 <li>POST /scrape - Scrape playlist with headless browser</li>
             </ul>
             
-            <h2>Browser Status:</h2>
+            <h2>Browser Status (snapshot at {datetime.now()}):</h2>
             <pre>{check_browser_availability()}</pre>
         </div>
     </body>
     </html>
     """
 
+def get_fallback_asset():
+    """Return the fallback page asset, rendering it once on first use"""
+    asset = _static_assets.get('<fallback>')
+    if asset:
+        return asset
+    
+    with _static_assets_lock:
+        asset = _static_assets.get('<fallback>')
+        if not asset:
+            asset = _build_static_asset(render_fallback_page().encode('utf-8'), 'text/html')
+            _static_assets['<fallback>'] = asset
+        return asset
+
+@app.route('/')
+def serve_frontend():
+    """Serve the frontend from memory"""
+    asset = None
+    try:
+        asset = load_static_asset(FRONTEND_PATH)
+    except Exception as e:
+        log_message(f"❌ Error serving frontend: {e}")
+    
+    return serve_static_asset(asset or get_fallback_asset())
+
+# Warm the frontend cache at import so gunicorn workers start with it loaded
+try:
+    load_static_asset(FRONTEND_PATH)
+except Exception as e:
+    log_message(f"⚠️ Could not preload frontend: {e}")
+
 if __name__ == '__main__':
     # Initialize logging
     try: